@@ -833,7 +833,7 @@ async def set_position(
 
         """
         index_packet = get_shutter_api_packet_index(self._device_type, index)
-        hex_pos = "{0:0{1}x}".format(position, 2)
+        hex_pos = f"{position:02x}"
 
         logger.debug("about to send set position command")
         timestamp, login_resp = await self._login()
@@ -16,7 +16,7 @@
 
 import re
 from binascii import hexlify
-from json import load
+from json import loads
 from logging import getLogger
 from pathlib import Path
 from typing import Any, Dict, List, Union, final
@@ -431,9 +431,8 @@ def get_remote(self, remote_id: str) -> SwitcherBreezeRemote:
         # check if the remote was already loaded
         if remote_id not in self._remotes_db:
             # load the remote into the memory
-            with open(self._remotes_db_fpath) as remotes_fd:
-                self._remotes_db[remote_id] = SwitcherBreezeRemote(
-                    load(remotes_fd)[remote_id]
-                )
+            self._remotes_db[remote_id] = SwitcherBreezeRemote(
+                loads(Path(self._remotes_db_fpath).read_bytes())[remote_id]
+            )
 
         return self._remotes_db[remote_id]
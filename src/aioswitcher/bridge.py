@@ -20,7 +20,6 @@
 from functools import partial
 from logging import getLogger
 from socket import AF_INET, inet_ntoa
-from struct import pack
 from types import TracebackType
 from typing import Any, Callable, Dict, List, Optional, Tuple, Type, final
 from warnings import warn
@@ -70,6 +69,12 @@
     DeviceCategory.LIGHT: SWITCHER_UDP_PORT_TYPE2_NEW_VERSION,
 }
 
+# lookup tables for the enum members encoded in the broadcast message
+_DEVICE_TYPES_BY_HEX = {d.hex_rep: d for d in DeviceType}
+_SHUTTER_DIRECTIONS = {d.value: d for d in ShutterDirection}
+_THERMOSTAT_MODES = {m.value: m for m in ThermostatMode}
+_THERMOSTAT_FAN_LEVELS = {f.value: f for f in ThermostatFanLevel}
+
 
 def _parse_device_from_datagram(
     device_callback: Callable[[SwitcherBase], Any], datagram: bytes
@@ -402,7 +407,7 @@ class DatagramParser:
 
     def is_switcher_originator(self) -> bool:
         """Verify the broadcast message had originated from a switcher device."""
-        return hexlify(self.message)[0:4].decode() == "fef0" and (
+        return hexlify(self.message[0:2]).decode() == "fef0" and (
             len(self.message) == 165
             or len(self.message) == 168  # Switcher Breeze
             or len(self.message) == 159  # Switcher Runner and RunnerMini
@@ -413,19 +418,15 @@ def is_switcher_originator(self) -> bool:
 
     def get_ip_type1(self) -> str:
         """Extract the IP address from the type1 broadcast message (Heater, Plug)."""
-        hex_ip = hexlify(self.message)[152:160]
-        ip_addr = int(hex_ip[6:8] + hex_ip[4:6] + hex_ip[2:4] + hex_ip[0:2], 16)
-        return inet_ntoa(pack("<L", ip_addr))
+        return inet_ntoa(self.message[76:80])
 
     def get_ip_type2(self) -> str:
         """Extract the IP address from the broadcast message (Breeze, Runners)."""
-        hex_ip = hexlify(self.message)[154:162]
-        ip_addr = int(hex_ip[0:2] + hex_ip[2:4] + hex_ip[4:6] + hex_ip[6:8], 16)
-        return inet_ntoa(pack(">L", ip_addr))
+        return inet_ntoa(self.message[77:81])
 
     def get_mac_type1(self) -> str:
         """Extract the MAC address from the broadcast message (Heater, Plug)."""
-        hex_mac = hexlify(self.message)[160:172].decode().upper()
+        hex_mac = hexlify(self.message[80:86]).decode().upper()
         return (
             hex_mac[0:2]
             + ":"
@@ -442,7 +443,7 @@ def get_mac_type1(self) -> str:
 
     def get_mac_type2(self) -> str:
         """Extract the MAC address from the broadcast message (Breeze, Runners)."""
-        hex_mac = hexlify(self.message)[162:174].decode().upper()
+        hex_mac = hexlify(self.message[81:87]).decode().upper()
         return (
             hex_mac[0:2]
             + ":"
@@ -463,15 +464,15 @@ def get_name(self) -> str:
 
     def get_device_id(self) -> str:
         """Extract the device id from the broadcast message."""
-        return hexlify(self.message)[36:42].decode()
+        return hexlify(self.message[18:21]).decode()
 
     def get_device_key(self) -> str:
         """Extract the device id from the broadcast message."""
-        return hexlify(self.message)[80:82].decode()
+        return hexlify(self.message[40:41]).decode()
 
     def get_device_state(self) -> DeviceState:
         """Extract the device state from the broadcast message."""
-        hex_device_state = hexlify(self.message)[266:268].decode()
+        hex_device_state = hexlify(self.message[133:134]).decode()
         return (
             DeviceState.ON
             if hex_device_state == DeviceState.ON.value
@@ -480,38 +481,22 @@ def get_device_state(self) -> DeviceState:
 
     def get_auto_shutdown(self) -> str:
         """Extract the auto shutdown value from the broadcast message."""
-        hex_auto_shutdown_val = hexlify(self.message)[310:318]
-        int_auto_shutdown_val_secs = int(
-            hex_auto_shutdown_val[6:8]
-            + hex_auto_shutdown_val[4:6]
-            + hex_auto_shutdown_val[2:4]
-            + hex_auto_shutdown_val[0:2],
-            16,
-        )
+        int_auto_shutdown_val_secs = int.from_bytes(self.message[155:159], "little")
         return seconds_to_iso_time(int_auto_shutdown_val_secs)
 
     def get_power_consumption(self) -> int:
         """Extract the power consumption from the broadcast message."""
-        hex_power_consumption = hexlify(self.message)[270:278]
-        return int(hex_power_consumption[2:4] + hex_power_consumption[0:2], 16)
+        return int.from_bytes(self.message[135:137], "little")
 
     def get_remaining(self) -> str:
         """Extract the time remains for the current execution."""
-        hex_remaining_time = hexlify(self.message)[294:302]
-        int_remaining_time_seconds = int(
-            hex_remaining_time[6:8]
-            + hex_remaining_time[4:6]
-            + hex_remaining_time[2:4]
-            + hex_remaining_time[0:2],
-            16,
-        )
+        int_remaining_time_seconds = int.from_bytes(self.message[147:151], "little")
         return seconds_to_iso_time(int_remaining_time_seconds)
 
     def get_device_type(self) -> DeviceType:
         """Extract the device type from the broadcast message."""
         hex_model = hexlify(self.message[74:76]).decode()
-        devices = dict(map(lambda d: (d.hex_rep, d), DeviceType))
-        return devices[hex_model]
+        return _DEVICE_TYPES_BY_HEX[hex_model]
 
     # Switcher Runners methods
 
@@ -527,8 +512,7 @@ def get_shutter_direction(self, index: int) -> ShutterDirection:
         start_index = 137 + (index * 16)
         end_index = start_index + 2
         hex_direction = hexlify(self.message[start_index:end_index]).decode()
-        directions = dict(map(lambda d: (d.value, d), ShutterDirection))
-        return directions[hex_direction]
+        return _SHUTTER_DIRECTIONS[hex_direction]
 
     def get_light_state(self, index: int) -> DeviceState:
         """Extract the light state from the broadcast message."""
@@ -546,8 +530,7 @@ def get_light_state(self, index: int) -> DeviceState:
 
     def get_thermostat_temp(self) -> float:
         """Return the current temp of the thermostat."""
-        hex_temp = hexlify(self.message[135:137]).decode()
-        return int(hex_temp[2:4] + hex_temp[0:2], 16) / 10
+        return int.from_bytes(self.message[135:137], "little") / 10
 
     def get_thermostat_state(self) -> DeviceState:
         """Return the current thermostat state."""
@@ -557,8 +540,7 @@ def get_thermostat_state(self) -> DeviceState:
     def get_thermostat_mode(self) -> ThermostatMode:
         """Return the current thermostat mode."""
         hex_mode = hexlify(self.message[138:139]).decode()
-        states = dict(map(lambda s: (s.value, s), ThermostatMode))
-        return ThermostatMode.COOL if hex_mode not in states else states[hex_mode]
+        return _THERMOSTAT_MODES.get(hex_mode, ThermostatMode.COOL)
 
     def get_thermostat_target_temp(self) -> int:
         """Return the current temp of the thermostat."""
@@ -568,8 +550,7 @@ def get_thermostat_target_temp(self) -> int:
     def get_thermostat_fan_level(self) -> ThermostatFanLevel:
         """Return the current thermostat fan level."""
         hex_level = hexlify(self.message[140:141]).decode()
-        states = dict(map(lambda s: (s.value, s), ThermostatFanLevel))
-        return states[hex_level[0:1]]
+        return _THERMOSTAT_FAN_LEVELS[hex_level[0:1]]
 
     def get_thermostat_swing(self) -> ThermostatSwing:
         """Return the current thermostat fan swing."""
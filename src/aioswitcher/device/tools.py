@@ -30,6 +30,8 @@
 
 logger = getLogger(__name__)
 
+_DEVICE_TYPES_BY_NAME = {device_type.value: device_type for device_type in DeviceType}
+
 
 def seconds_to_iso_time(all_seconds: int) -> str:
     """Convert seconds to iso time.
@@ -58,17 +60,11 @@ def sign_packet_with_crc_key(hex_packet: str) -> str:
         The calculated and signed packet.
 
     """
-    binary_packet = unhexlify(hex_packet)
-    binary_packet_crc = pack(">I", crc_hqx(binary_packet, 0x1021))
-    hex_packet_crc = hexlify(binary_packet_crc).decode()
-    hex_packet_crc_sliced = hex_packet_crc[6:8] + hex_packet_crc[4:6]
-
-    binary_key = unhexlify(hex_packet_crc_sliced + "30" * 32)
-    binary_key_crc = pack(">I", crc_hqx(binary_key, 0x1021))
-    hex_key_crc = hexlify(binary_key_crc).decode()
-    hex_key_crc_sliced = hex_key_crc[6:8] + hex_key_crc[4:6]
+    binary_packet_crc = crc_hqx(unhexlify(hex_packet), 0x1021).to_bytes(2, "little")
+    key_crc = crc_hqx(binary_packet_crc + b"0" * 32, 0x1021)
+    binary_key_crc = key_crc.to_bytes(2, "little")
 
-    return hex_packet + hex_packet_crc_sliced + hex_key_crc_sliced
+    return hex_packet + hexlify(binary_packet_crc + binary_key_crc).decode()
 
 
 def minutes_to_hexadecimal_seconds(minutes: int) -> str:
@@ -148,33 +144,7 @@ def set_message_length(message: str) -> str:
 
 def convert_str_to_devicetype(device_type: str) -> DeviceType:
     """Convert string name to DeviceType."""
-    if device_type == DeviceType.MINI.value:
-        return DeviceType.MINI
-    elif device_type == DeviceType.POWER_PLUG.value:
-        return DeviceType.POWER_PLUG
-    elif device_type == DeviceType.TOUCH.value:
-        return DeviceType.TOUCH
-    elif device_type == DeviceType.V2_ESP.value:
-        return DeviceType.V2_ESP
-    elif device_type == DeviceType.V2_QCA.value:
-        return DeviceType.V2_QCA
-    elif device_type == DeviceType.V4.value:
-        return DeviceType.V4
-    elif device_type == DeviceType.BREEZE.value:
-        return DeviceType.BREEZE
-    elif device_type == DeviceType.RUNNER.value:
-        return DeviceType.RUNNER
-    elif device_type == DeviceType.RUNNER_MINI.value:
-        return DeviceType.RUNNER_MINI
-    elif device_type == DeviceType.RUNNER_S11.value:
-        return DeviceType.RUNNER_S11
-    elif device_type == DeviceType.RUNNER_S12.value:
-        return DeviceType.RUNNER_S12
-    elif device_type == DeviceType.LIGHT_SL01.value:
-        return DeviceType.LIGHT_SL01
-    elif device_type == DeviceType.LIGHT_SL01_MINI.value:
-        return DeviceType.LIGHT_SL01_MINI
-    return DeviceType.MINI
+    return _DEVICE_TYPES_BY_NAME.get(device_type, DeviceType.MINI)
 
 
 def convert_token_to_packet(token: str) -> str:
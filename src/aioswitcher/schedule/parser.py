@@ -16,7 +16,6 @@
 
 from binascii import hexlify
 from dataclasses import dataclass, field
-from textwrap import wrap
 from typing import Set, final
 
 from . import Days, ScheduleState, tools
@@ -105,11 +104,11 @@ def get_end_time(self) -> str:
 
 def get_schedules(message: bytes) -> Set[SwitcherSchedule]:
     """Use to create a list of schedule from a response message from the device."""
-    hex_data = hexlify(message)[90:-8].decode()
-    hex_data_split = wrap(hex_data, 32)
+    schedules_data = message[45:-4]
     ret_set = set()
-    for schedule in hex_data_split:
-        parser = ScheduleParser(schedule.encode())
+    for offset in range(0, len(schedules_data), 16):
+        end = offset + 16
+        parser = ScheduleParser(hexlify(schedules_data[offset:end]))
         ret_set.add(
             SwitcherSchedule(
                 parser.get_id(),
@@ -17,18 +17,30 @@
 import time
 from binascii import hexlify
 from datetime import datetime, timedelta
+from itertools import combinations
 from struct import pack
-from typing import Set, Union
+from typing import Optional, Set, Union
 
 from . import Days
 
+_DAYS_BY_WEEKDAY = tuple(sorted(Days, key=lambda d: d.weekday))
+# hexadecimal bit summary of every possible combination of weekdays
+_WEEKDAYS_HEX = {
+    frozenset(weekdays): f"{sum(d.bit_rep for d in weekdays):02x}"
+    for count in range(1, len(Days) + 1)
+    for weekdays in combinations(Days, count)
+}
 
-def pretty_next_run(start_time: str, days: Set[Days] = set()) -> str:
+
+def pretty_next_run(
+    start_time: str, days: Set[Days] = set(), *, now: Optional[datetime] = None
+) -> str:
     """Create a literal for displaying the next run time.
 
     Args:
         start_time: the start of the schedule in "%H:%M" format, e.g. "17:00".
         days: for recurring schedules, a list of days when none, will be today.
+        now: the utc time to calculate the next run from, defaults to the current.
 
     Returns:
         A pretty string describing the next due run.
@@ -38,7 +50,7 @@ def pretty_next_run(start_time: str, days: Set[Days] = set()) -> str:
     if not days:
         return f"Due today at {start_time}"
 
-    current_datetime = datetime.utcnow()
+    current_datetime = now or datetime.utcnow()
     current_weekday = current_datetime.weekday()
 
     current_time = datetime.strptime(
@@ -49,29 +61,28 @@ def pretty_next_run(start_time: str, days: Set[Days] = set()) -> str:
         datetime.combine(datetime.today(), current_time) + timedelta(hours=1)
     ).time()
 
-    execution_days = [d.weekday for d in days]
+    execution_days = sum(1 << d.weekday for d in days)
     # if scheduled for later on today, return "due today"
-    if current_weekday in execution_days and (
+    if execution_days & (1 << current_weekday) and (
         current_time < schedule_time or current_time_plus_one_hour >= schedule_time
     ):
         return f"Due today at {start_time}"
 
-    execution_days.sort()
-    if current_weekday > execution_days[-1]:
-        next_exc_day = execution_days[0]
-    else:
-        next_exc_day = list(filter(lambda d: d >= current_weekday, execution_days))[0]
+    # rotate the weekdays mask so today is the lowest bit,
+    # the lowest set bit is then the number of days until the next execution
+    rotated_days = (
+        (execution_days >> current_weekday) | (execution_days << (7 - current_weekday))
+    ) & 0x7F
+    days_until_next_exc = (rotated_days & -rotated_days).bit_length() - 1
 
     # if next excution day is tomorrow for the current day, or this is the week end
     # (today is sunday and tomorrow is monday)  return "due tomorrow"
-    if next_exc_day - 1 == current_weekday or (
-        next_exc_day == Days.MONDAY.weekday and current_weekday == Days.SUNDAY.weekday
-    ):
+    if days_until_next_exc == 1:
         return f"Due tomorrow at {start_time}"
 
     # if here, then the scuedle is due some other day this week, return "due at..."
-    weekdays = dict(map(lambda d: (d.weekday, d), Days))
-    return f"Due next {weekdays[next_exc_day].value} at {start_time}"
+    next_exc_day = _DAYS_BY_WEEKDAY[(current_weekday + days_until_next_exc) % 7]
+    return f"Due next {next_exc_day.value} at {start_time}"
 
 
 def calc_duration(start_time: str, end_time: str) -> str:
@@ -139,10 +150,10 @@ def weekdays_to_hexadecimal(days: Union[Days, Set[Days]]) -> str:
     """
     if days:
         if type(days) is Days:
-            return "{:02x}".format(days.bit_rep)
-        elif type(days) is set or len(days) == len(set(days)):  # type: ignore
-            map_to_bits = map(lambda w: w.bit_rep, days)  # type: ignore
-            return "{:02x}".format(int(sum(map_to_bits)))
+            return _WEEKDAYS_HEX[frozenset((days,))]
+        requested_days = frozenset(days)  # type: ignore
+        if len(requested_days) == len(days):  # type: ignore
+            return _WEEKDAYS_HEX[requested_days]
     raise ValueError("no days requested")
 
 
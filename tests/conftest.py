@@ -0,0 +1,37 @@
+# Copyright Tomer Figenblat.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Switcher integration test suite configuration."""
+
+from asyncio import DefaultEventLoopPolicy, get_event_loop_policy, set_event_loop_policy
+
+from pytest import fixture
+
+
+def pytest_configure(config):
+    # uvloop can't be installed on windows, use the default asyncio loop without it
+    try:
+        import uvloop
+    except ImportError:
+        set_event_loop_policy(DefaultEventLoopPolicy())
+    else:
+        set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+@fixture(scope="session")
+def event_loop():
+    # a single loop for the whole session, the tests leave no tasks running on it
+    loop = get_event_loop_policy().new_event_loop()
+    yield loop
+    loop.close()
@@ -14,12 +14,11 @@
 
 """Switcher integration UDP bridge module test cases."""
 import socket
-from asyncio import sleep
-from binascii import unhexlify
+from asyncio import Event, wait_for
+from logging import Logger
 from pathlib import Path
 from unittest.mock import Mock, patch
 
-from assertpy import assert_that
 from pytest import fixture, mark
 
 from aioswitcher.bridge import SwitcherBridge
@@ -32,18 +31,19 @@ def mock_callback():
     return Mock()
 
 
-@fixture
+@fixture(scope="module")
 def udp_broadcast_server():
     server = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
     server.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
     server.settimeout(0.2)
-    return server
+    yield server
+    server.close()
 
 
-@patch("logging.Logger.info")
+@patch.object(Logger, "info")
 async def test_stopping_before_started_and_establishing_a_connection_should_write_to_the_info_output(mock_info, mock_callback):
     bridge = SwitcherBridge(mock_callback, [1234])
-    assert_that(bridge.is_running).is_false()
+    assert not bridge.is_running
     await bridge.stop()
     mock_info.assert_called_with("udp bridge on port %s not started", 1234)
 
@@ -51,28 +51,35 @@ async def test_stopping_before_started_and_establishing_a_connection_should_writ
 async def test_bridge_operation_as_a_context_manager(unused_udp_port_factory, mock_callback):
     port = unused_udp_port_factory()
     async with SwitcherBridge(mock_callback, [port]) as bridge:
-        assert_that(bridge.is_running).is_true()
+        assert bridge.is_running
 
 
 async def test_bridge_start_and_stop_operations(unused_udp_port_factory, mock_callback):
     port = unused_udp_port_factory()
     bridge = SwitcherBridge(mock_callback, [port])
-    assert_that(bridge.is_running).is_false()
+    assert not bridge.is_running
     await bridge.start()
-    assert_that(bridge.is_running).is_true()
+    assert bridge.is_running
     await bridge.stop()
-    assert_that(bridge.is_running).is_false()
+    assert not bridge.is_running
 
 
 async def test_bridge_callback_loading(udp_broadcast_server, unused_udp_port_factory, mock_callback, resource_path):
     port = unused_udp_port_factory()
-    sut_v2_off_datagram = Path(f'{resource_path}_v2_off.txt').read_text().replace('\n', '').encode()
-    sut_power_plug_off_datagram = Path(f'{resource_path}_power_plug_off.txt').read_text().replace('\n', '').encode()
+    sut_v2_off_datagram = bytes.fromhex(Path(f'{resource_path}_v2_off.txt').read_text())
+    sut_power_plug_off_datagram = bytes.fromhex(Path(f'{resource_path}_power_plug_off.txt').read_text())
+
+    both_received = Event()
+
+    def _on_device(_):
+        if mock_callback.call_count == 2:
+            both_received.set()
+
+    mock_callback.side_effect = _on_device
 
     async with SwitcherBridge(mock_callback, [port]):
-        udp_broadcast_server.sendto(unhexlify(sut_v2_off_datagram), ("localhost", port))
-        await sleep(0.2)
-        udp_broadcast_server.sendto(unhexlify(sut_power_plug_off_datagram), ("localhost", port))
-        await sleep(0.2)
+        udp_broadcast_server.sendto(sut_v2_off_datagram, ("localhost", port))
+        udp_broadcast_server.sendto(sut_power_plug_off_datagram, ("localhost", port))
+        await wait_for(both_received.wait(), timeout=1.0)
 
-    assert_that(mock_callback.call_count).is_equal_to(2)
+    assert mock_callback.call_count == 2
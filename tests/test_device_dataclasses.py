@@ -17,8 +17,7 @@
 from dataclasses import dataclass, field
 from typing import List
 
-from assertpy import assert_that
-from pytest import fixture, mark
+from pytest import fixture, mark, raises
 
 from aioswitcher.device import (
     DeviceState,
@@ -36,6 +35,8 @@
     ThermostatSwing,
 )
 
+_WATER_HEATER_TYPES = (DeviceType.MINI, DeviceType.TOUCH, DeviceType.V2_ESP, DeviceType.V2_QCA, DeviceType.V4)
+
 
 @dataclass(frozen=True)
 class FakeData:
@@ -65,12 +66,12 @@ class FakeData:
     lights2: List[DeviceState] = field(default_factory=lambda: [DeviceState.ON, DeviceState.ON])
 
 
-@fixture
+@fixture(scope="module")
 def fake_data():
     return FakeData()
 
 
-@mark.parametrize("device_type", [DeviceType.MINI, DeviceType.TOUCH, DeviceType.V2_ESP, DeviceType.V2_QCA, DeviceType.V4])
+@mark.parametrize("device_type", _WATER_HEATER_TYPES)
 def test_given_a_device_of_type_water_heater_when_instantiating_as_a_water_heater_should_be_instatiated_properly(fake_data, device_type):
     sut = SwitcherWaterHeater(
         device_type,
@@ -87,17 +88,17 @@ def test_given_a_device_of_type_water_heater_when_instantiating_as_a_water_heate
         fake_data.auto_shutdown,
     )
 
-    assert_that(sut.device_type).is_equal_to(device_type)
-    assert_that(sut.device_state).is_equal_to(DeviceState.ON)
-    assert_that(sut.device_id).is_equal_to(fake_data.device_id)
-    assert_that(sut.ip_address).is_equal_to(fake_data.ip_address)
-    assert_that(sut.mac_address).is_equal_to(fake_data.mac_address)
-    assert_that(sut.name).is_equal_to(fake_data.name)
-    assert_that(sut.power_consumption).is_equal_to(fake_data.power_consumption)
-    assert_that(sut.electric_current).is_equal_to(fake_data.electric_current)
-    assert_that(sut.remaining_time).is_equal_to(fake_data.remaining_time)
-    assert_that(sut.auto_shutdown).is_equal_to(fake_data.auto_shutdown)
-    assert_that(sut.auto_off_set).is_equal_to(fake_data.auto_shutdown)
+    assert sut.device_type == device_type
+    assert sut.device_state == DeviceState.ON
+    assert sut.device_id == fake_data.device_id
+    assert sut.ip_address == fake_data.ip_address
+    assert sut.mac_address == fake_data.mac_address
+    assert sut.name == fake_data.name
+    assert sut.power_consumption == fake_data.power_consumption
+    assert sut.electric_current == fake_data.electric_current
+    assert sut.remaining_time == fake_data.remaining_time
+    assert sut.auto_shutdown == fake_data.auto_shutdown
+    assert sut.auto_off_set == fake_data.auto_shutdown
 
 
 def test_given_a_device_of_type_power_plug_when_instantiating_as_a_power_plug_should_be_instatiated_properly(fake_data):
@@ -114,14 +115,14 @@ def test_given_a_device_of_type_power_plug_when_instantiating_as_a_power_plug_sh
         fake_data.electric_current,
     )
 
-    assert_that(sut.device_type).is_equal_to(DeviceType.POWER_PLUG)
-    assert_that(sut.device_state).is_equal_to(DeviceState.ON)
-    assert_that(sut.device_id).is_equal_to(fake_data.device_id)
-    assert_that(sut.ip_address).is_equal_to(fake_data.ip_address)
-    assert_that(sut.mac_address).is_equal_to(fake_data.mac_address)
-    assert_that(sut.name).is_equal_to(fake_data.name)
-    assert_that(sut.power_consumption).is_equal_to(fake_data.power_consumption)
-    assert_that(sut.electric_current).is_equal_to(fake_data.electric_current)
+    assert sut.device_type == DeviceType.POWER_PLUG
+    assert sut.device_state == DeviceState.ON
+    assert sut.device_id == fake_data.device_id
+    assert sut.ip_address == fake_data.ip_address
+    assert sut.mac_address == fake_data.mac_address
+    assert sut.name == fake_data.name
+    assert sut.power_consumption == fake_data.power_consumption
+    assert sut.electric_current == fake_data.electric_current
 
 
 def test_given_a_device_of_type_thermostat_when_instantiating_as_a_thermostat_should_be_instatiated_properly(fake_data):
@@ -142,18 +143,18 @@ def test_given_a_device_of_type_thermostat_when_instantiating_as_a_thermostat_sh
         fake_data.remote_id
     )
 
-    assert_that(sut.device_type).is_equal_to(DeviceType.BREEZE)
-    assert_that(sut.device_state).is_equal_to(DeviceState.ON)
-    assert_that(sut.device_id).is_equal_to(fake_data.device_id)
-    assert_that(sut.ip_address).is_equal_to(fake_data.ip_address)
-    assert_that(sut.mac_address).is_equal_to(fake_data.mac_address)
-    assert_that(sut.name).is_equal_to(fake_data.name)
-    assert_that(sut.mode).is_equal_to(fake_data.mode)
-    assert_that(sut.temperature).is_equal_to(fake_data.temperature)
-    assert_that(sut.target_temperature).is_equal_to(fake_data.target_temperature)
-    assert_that(sut.fan_level).is_equal_to(fake_data.fan_level)
-    assert_that(sut.swing).is_equal_to(fake_data.swing)
-    assert_that(sut.remote_id).is_equal_to(fake_data.remote_id)
+    assert sut.device_type == DeviceType.BREEZE
+    assert sut.device_state == DeviceState.ON
+    assert sut.device_id == fake_data.device_id
+    assert sut.ip_address == fake_data.ip_address
+    assert sut.mac_address == fake_data.mac_address
+    assert sut.name == fake_data.name
+    assert sut.mode == fake_data.mode
+    assert sut.temperature == fake_data.temperature
+    assert sut.target_temperature == fake_data.target_temperature
+    assert sut.fan_level == fake_data.fan_level
+    assert sut.swing == fake_data.swing
+    assert sut.remote_id == fake_data.remote_id
 
 
 def test_given_a_device_of_type_shutter_when_instantiating_as_a_shutter_should_be_instatiated_properly(fake_data):
@@ -170,124 +171,54 @@ def test_given_a_device_of_type_shutter_when_instantiating_as_a_shutter_should_b
         fake_data.direction
     )
 
-    assert_that(sut.device_type).is_equal_to(DeviceType.RUNNER)
-    assert_that(sut.device_state).is_equal_to(DeviceState.ON)
-    assert_that(sut.device_id).is_equal_to(fake_data.device_id)
-    assert_that(sut.ip_address).is_equal_to(fake_data.ip_address)
-    assert_that(sut.mac_address).is_equal_to(fake_data.mac_address)
-    assert_that(sut.name).is_equal_to(fake_data.name)
-    assert_that(sut.position).is_equal_to(fake_data.position)
-    assert_that(sut.direction).is_equal_to(fake_data.direction)
+    assert sut.device_type == DeviceType.RUNNER
+    assert sut.device_state == DeviceState.ON
+    assert sut.device_id == fake_data.device_id
+    assert sut.ip_address == fake_data.ip_address
+    assert sut.mac_address == fake_data.mac_address
+    assert sut.name == fake_data.name
+    assert sut.position == fake_data.position
+    assert sut.direction == fake_data.direction
 
 
-@mark.parametrize("device_type", [DeviceType.MINI, DeviceType.TOUCH, DeviceType.V2_ESP, DeviceType.V2_QCA, DeviceType.V4])
+@mark.parametrize("device_type", _WATER_HEATER_TYPES)
 def test_given_a_device_of_type_water_heater_when_instantiating_as_a_power_plug_should_raise_an_error(fake_data, device_type):
-    assert_that(SwitcherPowerPlug).raises(ValueError).when_called_with(
-        device_type,
-        DeviceState.ON,
-        fake_data.device_id,
-        fake_data.device_key,
-        fake_data.ip_address,
-        fake_data.mac_address,
-        fake_data.name,
-        fake_data.token_needed,
-        fake_data.power_consumption,
-        fake_data.electric_current,
-    ).is_equal_to("only power plugs are allowed")
-
-
-def test_given_a_device_of_type_power_plug_when_instantiating_as_a_water_heater_should_raise_an_error(fake_data):
-    assert_that(SwitcherWaterHeater).raises(ValueError).when_called_with(
-        DeviceType.POWER_PLUG,
-        DeviceState.ON,
-        fake_data.device_id,
-        fake_data.device_key,
-        fake_data.ip_address,
-        fake_data.mac_address,
-        fake_data.name,
-        fake_data.token_needed,
-        fake_data.power_consumption,
-        fake_data.electric_current,
-        fake_data.remaining_time,
-        fake_data.auto_shutdown,
-    ).is_equal_to("only water heaters are allowed")
-
-
-def test_given_a_device_of_type_power_plug_when_instantiating_as_a_thermostatr_should_raise_an_error(fake_data):
-    assert_that(SwitcherThermostat).raises(ValueError).when_called_with(
-        DeviceType.POWER_PLUG,
-        DeviceState.ON,
-        fake_data.device_id,
-        fake_data.device_key,
-        fake_data.ip_address,
-        fake_data.mac_address,
-        fake_data.name,
-        fake_data.token_needed,
-        fake_data.mode,
-        fake_data.temperature,
-        fake_data.target_temperature,
-        fake_data.fan_level,
-        fake_data.swing,
-        fake_data.remote_id
-    ).is_equal_to("only thermostats are allowed")
-
-
-def test_given_a_device_of_type_power_plug_when_instantiating_as_a_shutter_should_raise_an_error(fake_data):
-    assert_that(SwitcherShutter).raises(ValueError).when_called_with(
-        DeviceType.POWER_PLUG,
-        DeviceState.ON,
-        fake_data.device_id,
-        fake_data.device_key,
-        fake_data.ip_address,
-        fake_data.mac_address,
-        fake_data.name,
-        fake_data.token_needed,
-        fake_data.position,
-        fake_data.direction
-    ).is_equal_to("only shutters are allowed")
-
-
-def test_given_a_device_of_type_power_plug_when_instantiating_as_a_single_shutter_dual_light_should_raise_an_error(fake_data):
-    assert_that(SwitcherSingleShutterDualLight).raises(ValueError).when_called_with(
-        DeviceType.POWER_PLUG,
-        DeviceState.ON,
-        fake_data.device_id,
-        fake_data.device_key,
-        fake_data.ip_address,
-        fake_data.mac_address,
-        fake_data.name,
-        fake_data.token_needed,
-        fake_data.position,
-        fake_data.direction,
-        fake_data.lights2
-    ).is_equal_to("only shutters with dual lights are allowed")
-
-
-def test_given_a_device_of_type_power_plug_when_instantiating_as_a_dual_shutter_single_light_should_raise_an_error(fake_data):
-    assert_that(SwitcherDualShutterSingleLight).raises(ValueError).when_called_with(
-        DeviceType.POWER_PLUG,
-        DeviceState.ON,
-        fake_data.device_id,
-        fake_data.device_key,
-        fake_data.ip_address,
-        fake_data.mac_address,
-        fake_data.name,
-        fake_data.token_needed,
-        fake_data.position2,
-        fake_data.direction2,
-        fake_data.lights
-    ).is_equal_to("only dual shutters with single lights are allowed")
-
-
-def test_given_a_device_of_type_power_plug_when_instantiating_as_a_light_should_raise_an_error(fake_data):
-    assert_that(SwitcherLight).raises(ValueError).when_called_with(
-        DeviceType.POWER_PLUG,
-        DeviceState.ON,
-        fake_data.device_id,
-        fake_data.device_key,
-        fake_data.ip_address,
-        fake_data.mac_address,
-        fake_data.name,
-        fake_data.token_needed,
-        fake_data.lights
-    ).is_equal_to("only lights are allowed")
+    with raises(ValueError, match="only power plugs are allowed"):
+        SwitcherPowerPlug(
+            device_type,
+            DeviceState.ON,
+            fake_data.device_id,
+            fake_data.device_key,
+            fake_data.ip_address,
+            fake_data.mac_address,
+            fake_data.name,
+            fake_data.token_needed,
+            fake_data.power_consumption,
+            fake_data.electric_current,
+        )
+
+
+@mark.parametrize(
+    "sut_cls, extra_fields, expected_error",
+    [
+        (SwitcherWaterHeater, ("power_consumption", "electric_current", "remaining_time", "auto_shutdown"), "only water heaters are allowed"),
+        (SwitcherThermostat, ("mode", "temperature", "target_temperature", "fan_level", "swing", "remote_id"), "only thermostats are allowed"),
+        (SwitcherShutter, ("position", "direction"), "only shutters are allowed"),
+        (SwitcherSingleShutterDualLight, ("position", "direction", "lights2"), "only shutters with dual lights are allowed"),
+        (SwitcherDualShutterSingleLight, ("position2", "direction2", "lights"), "only dual shutters with single lights are allowed"),
+        (SwitcherLight, ("lights",), "only lights are allowed"),
+    ],
+)
+def test_given_a_device_of_type_power_plug_when_instantiating_as_a_different_device_should_raise_an_error(fake_data, sut_cls, extra_fields, expected_error):
+    with raises(ValueError, match=expected_error):
+        sut_cls(
+            DeviceType.POWER_PLUG,
+            DeviceState.ON,
+            fake_data.device_id,
+            fake_data.device_key,
+            fake_data.ip_address,
+            fake_data.mac_address,
+            fake_data.name,
+            fake_data.token_needed,
+            *(getattr(fake_data, field_name) for field_name in extra_fields),
+        )
@@ -14,11 +14,10 @@
 
 """Switcher integration parsing devices from datagrams test cases."""
 
-from binascii import unhexlify
+from logging import Logger
 from pathlib import Path
 from unittest.mock import Mock, patch
 
-from assertpy import assert_that
 from pytest import fixture, warns
 
 from aioswitcher.bridge import DatagramParser, _parse_device_from_datagram
@@ -44,10 +43,15 @@ def mock_device():
     return Mock()
 
 
-@patch("logging.Logger.debug")
+@fixture
+def sut_datagram(resource_path):
+    return bytes.fromhex(Path(f'{resource_path}.txt').read_text())
+
+
+@patch.object(Logger, "debug")
 @patch.object(DatagramParser, "is_switcher_originator", lambda s: False)
 def test_an_unknown_datagram_not_produces_device(mock_debug, mock_callback):
-    assert_that(_parse_device_from_datagram(mock_callback, "a moot datagram")).is_none()
+    assert _parse_device_from_datagram(mock_callback, "a moot datagram") is None
     mock_debug.assert_called_once_with("received datagram from an unknown source")
     mock_callback.assert_not_called()
 
@@ -63,62 +67,55 @@ def test_an_unknown_device_type_produces_a_warning(mock_callback):
 
 @patch.object(SwitcherWaterHeater, "__new__")
 @patch.object(DatagramParser, "is_switcher_originator", lambda s: True)
-def test_a_water_heater_datagram_produces_device(mock_device_cls, mock_device, resource_path, mock_callback):
+def test_a_water_heater_datagram_produces_device(mock_device_cls, mock_device, sut_datagram, mock_callback):
     mock_device_cls.return_value = mock_device
-    sut_datagram = Path(f'{resource_path}.txt').read_text().replace('\n', '').encode()
-    _parse_device_from_datagram(mock_callback, unhexlify(sut_datagram))
+    _parse_device_from_datagram(mock_callback, sut_datagram)
     mock_callback.assert_called_once_with(mock_device)
 
 
 @patch.object(SwitcherPowerPlug, "__new__")
 @patch.object(DatagramParser, "is_switcher_originator", lambda s: True)
-def test_a_power_plug_datagram_produces_device(mock_device_cls, mock_device, resource_path, mock_callback):
+def test_a_power_plug_datagram_produces_device(mock_device_cls, mock_device, sut_datagram, mock_callback):
     mock_device_cls.return_value = mock_device
-    sut_datagram = Path(f'{resource_path}.txt').read_text().replace('\n', '').encode()
-    _parse_device_from_datagram(mock_callback, unhexlify(sut_datagram))
+    _parse_device_from_datagram(mock_callback, sut_datagram)
     mock_callback.assert_called_once_with(mock_device)
 
 
 @patch.object(SwitcherThermostat, "__new__")
 @patch.object(DatagramParser, "is_switcher_originator", lambda s: True)
-def test_a_breeze_datagram_produces_device(mock_device_cls, mock_device, resource_path, mock_callback):
+def test_a_breeze_datagram_produces_device(mock_device_cls, mock_device, sut_datagram, mock_callback):
     mock_device_cls.return_value = mock_device
-    sut_datagram = Path(f'{resource_path}.txt').read_text().replace('\n', '').encode()
-    _parse_device_from_datagram(mock_callback, unhexlify(sut_datagram))
+    _parse_device_from_datagram(mock_callback, sut_datagram)
     mock_callback.assert_called_once_with(mock_device)
 
 
 @patch.object(SwitcherShutter, "__new__")
 @patch.object(DatagramParser, "is_switcher_originator", lambda s: True)
-def test_a_runner_datagram_produces_device(mock_device_cls, mock_device, resource_path, mock_callback):
+def test_a_runner_datagram_produces_device(mock_device_cls, mock_device, sut_datagram, mock_callback):
     mock_device_cls.return_value = mock_device
-    sut_datagram = Path(f'{resource_path}.txt').read_text().replace('\n', '').encode()
-    _parse_device_from_datagram(mock_callback, unhexlify(sut_datagram))
+    _parse_device_from_datagram(mock_callback, sut_datagram)
     mock_callback.assert_called_once_with(mock_device)
 
 
 @patch.object(SwitcherSingleShutterDualLight, "__new__")
 @patch.object(DatagramParser, "is_switcher_originator", lambda s: True)
-def test_a_single_runner_dual_light_datagram_produces_device(mock_device_cls, mock_device, resource_path, mock_callback):
+def test_a_single_runner_dual_light_datagram_produces_device(mock_device_cls, mock_device, sut_datagram, mock_callback):
     mock_device_cls.return_value = mock_device
-    sut_datagram = Path(f'{resource_path}.txt').read_text().replace('\n', '').encode()
-    _parse_device_from_datagram(mock_callback, unhexlify(sut_datagram))
+    _parse_device_from_datagram(mock_callback, sut_datagram)
     mock_callback.assert_called_once_with(mock_device)
 
 
 @patch.object(SwitcherDualShutterSingleLight, "__new__")
 @patch.object(DatagramParser, "is_switcher_originator", lambda s: True)
-def test_a_dual_runner_single_light_datagram_produces_device(mock_device_cls, mock_device, resource_path, mock_callback):
+def test_a_dual_runner_single_light_datagram_produces_device(mock_device_cls, mock_device, sut_datagram, mock_callback):
     mock_device_cls.return_value = mock_device
-    sut_datagram = Path(f'{resource_path}.txt').read_text().replace('\n', '').encode()
-    _parse_device_from_datagram(mock_callback, unhexlify(sut_datagram))
+    _parse_device_from_datagram(mock_callback, sut_datagram)
     mock_callback.assert_called_once_with(mock_device)
 
 
 @patch.object(SwitcherLight, "__new__")
 @patch.object(DatagramParser, "is_switcher_originator", lambda s: True)
-def test_a_light_datagram_produces_device(mock_device_cls, mock_device, resource_path, mock_callback):
+def test_a_light_datagram_produces_device(mock_device_cls, mock_device, sut_datagram, mock_callback):
     mock_device_cls.return_value = mock_device
-    sut_datagram = Path(f'{resource_path}.txt').read_text().replace('\n', '').encode()
-    _parse_device_from_datagram(mock_callback, unhexlify(sut_datagram))
+    _parse_device_from_datagram(mock_callback, sut_datagram)
     mock_callback.assert_called_once_with(mock_device)
@@ -14,87 +14,93 @@
 
 """Switcher integration device module tools test cases."""
 
-from binascii import unhexlify
-from datetime import datetime, timedelta
-from struct import unpack
-from unittest.mock import patch
+from datetime import timedelta
+from time import time
+from unittest.mock import AsyncMock, patch
 
-import pytest_asyncio
-from assertpy import assert_that
-from pytest import mark
+from aiohttp import ClientSession
+from pytest import fixture, mark, param, raises
 
 from aioswitcher.device import DeviceType, tools
 
+_LONG_NAME = "t" * 33
+# "my device cool name" right padded with zeros to 32 bytes
+_HEX_DEVICE_NAME = "6d792064657669636520636f6f6c206e616d6500000000000000000000000000"
+
+
+@fixture(scope="module")
+def mock_post():
+    with patch.object(ClientSession, "post") as post:
+        yield post
+
 
 def test_seconds_to_iso_time_with_a_valid_seconds_value_should_return_a_time_string():
-    assert_that(tools.seconds_to_iso_time(86399)).is_equal_to("23:59:59")
+    assert tools.seconds_to_iso_time(86399) == "23:59:59"
 
 
 def test_seconds_to_iso_time_with_a_nagative_value_should_throw_an_error():
-    assert_that(tools.seconds_to_iso_time).raises(
-        ValueError
-    ).when_called_with(-1).is_equal_to("hour must be in 0..23")
+    with raises(ValueError, match="hour must be in 0..23"):
+        tools.seconds_to_iso_time(-1)
 
 
-def test_minutes_to_hexadecimal_seconds_with_correct_minutes_should_return_expected_hex_seconds():
-    # TODO: replace the equality assertion with an unhexlified unpacked value
-    hex_sut = tools.minutes_to_hexadecimal_seconds(90)
-    assert_that(hex_sut).is_equal_to("18150000")
+@mark.parametrize("minutes, seconds", [(1, 60), (90, 5400), (1439, 86340)])
+def test_minutes_to_hexadecimal_seconds_with_correct_minutes_should_return_expected_hex_seconds(minutes, seconds):
+    hex_sut = tools.minutes_to_hexadecimal_seconds(minutes)
+    assert bytes.fromhex(hex_sut) == seconds.to_bytes(4, "little")
 
 
 def test_minutes_to_hexadecimal_seconds_with_a_negative_value_should_throw_an_error():
-    assert_that(tools.minutes_to_hexadecimal_seconds).raises(
-        Exception
-    ).when_called_with(-1).is_equal_to("argument out of range")
+    with raises(Exception, match="argument out of range"):
+        tools.minutes_to_hexadecimal_seconds(-1)
 
 
-def test_timedelta_to_hexadecimal_seconds_with_an_allowed_timedelta_should_return_an_hex_timestamp():
-    # TODO: replace the equality assertion with an unhexlified unpacked value
-    hex_timestamp = tools.timedelta_to_hexadecimal_seconds(timedelta(hours=1, minutes=30))
-    assert_that(hex_timestamp).is_equal_to("18150000")
+@mark.parametrize("allowed_timedelta, seconds", [
+    param(timedelta(hours=1), 3600, id="one_hour"),
+    param(timedelta(hours=1, minutes=30), 5400, id="hour_and_a_half"),
+    param(timedelta(hours=2, seconds=59), 7200, id="seconds_are_ignored"),
+    param(timedelta(hours=23, minutes=59), 86340, id="almost_a_day"),
+])
+def test_timedelta_to_hexadecimal_seconds_with_an_allowed_timedelta_should_return_an_hex_timestamp(allowed_timedelta, seconds):
+    hex_timestamp = tools.timedelta_to_hexadecimal_seconds(allowed_timedelta)
+    assert bytes.fromhex(hex_timestamp) == seconds.to_bytes(4, "little")
 
 
 @mark.parametrize("out_of_range", [timedelta(minutes=59), timedelta(hours=24)])
 def test_timedelta_to_hexadecimal_seconds_with_an_out_of_range_value_should_throw_an_error(out_of_range):
-    assert_that(tools.timedelta_to_hexadecimal_seconds).raises(
-        ValueError
-    ).when_called_with(out_of_range).starts_with("can only handle 1 to 24 hours")
+    with raises(ValueError, match="can only handle 1 to 24 hours"):
+        tools.timedelta_to_hexadecimal_seconds(out_of_range)
 
 
 def test_string_to_hexadecimale_device_name_with_a_correct_length_name_should_return_a_right_zero_padded_hex_name():
-    str_name = "my device cool name"
-    hex_name = tools.string_to_hexadecimale_device_name(str_name)
-    unhexed_name = unhexlify(hex_name.rstrip("0")).decode()
-    assert_that(unhexed_name).is_equal_to(str_name)
+    hex_name = tools.string_to_hexadecimale_device_name("my device cool name")
+    assert hex_name == _HEX_DEVICE_NAME
 
 
-@mark.parametrize("unsupported_length_value", ["t", "t" * 33])
+@mark.parametrize("unsupported_length_value", ["t", _LONG_NAME])
 def test_string_to_hexadecimale_device_name_with_an_unsupported_length_value_should_throw_an_error(unsupported_length_value):
-    assert_that(tools.string_to_hexadecimale_device_name).raises(
-        ValueError
-    ).when_called_with(unsupported_length_value).starts_with("name length can vary from 2 to 32")
+    with raises(ValueError, match="name length can vary from 2 to 32"):
+        tools.string_to_hexadecimale_device_name(unsupported_length_value)
 
 
 def test_current_timestamp_to_hexadecimal_should_return_the_current_timestamp():
+    before = round(time())
     hex_timestamp = tools.current_timestamp_to_hexadecimal()
+    after = round(time())
 
-    binary_timestamp = unhexlify(hex_timestamp.encode())
-    unpacked_timestamp = unpack("<I", binary_timestamp)
-    sut_datetime = datetime.fromtimestamp(unpacked_timestamp[0])
+    unpacked_timestamp = int.from_bytes(bytes.fromhex(hex_timestamp), "little")
 
-    assert_that(sut_datetime).is_equal_to_ignoring_time(datetime.now())
+    assert before <= unpacked_timestamp <= after
 
 
-@patch("time.time", return_value=-1)
+@patch.object(tools.time, "time", return_value=-1)
 def test_current_timestamp_to_hexadecimal_with_errornous_value_should_throw_an_error(_):
-    assert_that(tools.current_timestamp_to_hexadecimal).raises(
-        Exception
-    ).when_called_with().is_equal_to("argument out of range")
+    with raises(Exception, match="argument out of range"):
+        tools.current_timestamp_to_hexadecimal()
 
 
 @mark.parametrize("watts, amps", [(1608, 7.3), (2600, 11.8), (3489, 15.9)])
 def test_watts_to_amps_with_parameterized_watts_should_procude_expected_amps(watts, amps):
-    assert_that(tools.watts_to_amps(watts)).is_equal_to(amps)
+    assert tools.watts_to_amps(watts) == amps
 
 
 @mark.parametrize("str, type", [
@@ -113,21 +119,21 @@ def test_watts_to_amps_with_parameterized_watts_should_procude_expected_amps(wat
     ("Switcher Light SL01 Mini", DeviceType.LIGHT_SL01_MINI)
     ])
 def test_convert_str_to_devicetype_should_return_expected_devicetype(str, type):
-    assert_that(tools.convert_str_to_devicetype(str)).is_equal_to(type)
+    assert tools.convert_str_to_devicetype(str) == type
 
 
 @mark.parametrize("str, type", [
     ("Switcher new device does not define", DeviceType.MINI)
     ])
 def test_convert_str_to_devicetype_with_unknown_device_should_return_mini(str, type):
-    assert_that(tools.convert_str_to_devicetype(str)).is_equal_to(type)
+    assert tools.convert_str_to_devicetype(str) == type
 
 
 @mark.parametrize("token, token_packet", [
     ("zvVvd7JxtN7CgvkD1Psujw==", "eafc3e34")
     ])
 def test_convert_token_to_packet_should_return_expected_packet(token, token_packet):
-    assert_that(tools.convert_token_to_packet(token)).is_equal_to(token_packet)
+    assert tools.convert_token_to_packet(token) == token_packet
 
 
 @mark.parametrize("token, error_type, response", [
@@ -135,167 +141,70 @@ def test_convert_token_to_packet_should_return_expected_packet(token, token_pack
     ("zvVvd7J", RuntimeError, "convert token to packet was not successful")
     ])
 def test_convert_token_to_packet_with_false_token_should_throw_an_error(token, error_type, response):
-    assert_that(tools.convert_token_to_packet).raises(
-        error_type
-    ).when_called_with(token).is_equal_to(response)
+    with raises(error_type, match=response):
+        tools.convert_token_to_packet(token)
 
 
-@pytest_asyncio.fixture
-@mark.parametrize("username, token, is_token_valid", [
-    ("test@switcher.com", "zvVvd7JxtN7CgvkD1Psujw==", True)
-    ])
-async def test_validate_token_should_return_token_valid(mock_post, username, token, is_token_valid):
-    mock_response = mock_post.return_value
-    mock_response.status_code = 200
-    mock_response.json.return_value = {"result": "True"}
-    assert_that(tools.validate_token(username, token)).is_equal_to(is_token_valid)
-
-
-@pytest_asyncio.fixture
-@mark.parametrize("username, token, is_token_valid", [
-    ("test@switcher.com", "", False),
-    ("test@switcher.com", "notvalidtoken", False),
-    ("", "notvalidtoken", False),
-    ("", "", False)
-    ])
-async def test_validate_token_should_return_token_invalid(mock_post, username, token, is_token_valid):
-    mock_response = mock_post.return_value
-    mock_response.status_code = 200
-    mock_response.json.return_value = {"result": "False"}
-    assert_that(tools.validate_token(username, token)).is_equal_to(is_token_valid)
-
-
-@mark.parametrize("device_type, circuit_number, index", [
-    (DeviceType.RUNNER, 0, 0),
-    (DeviceType.RUNNER_MINI, 0, 0),
-    (DeviceType.RUNNER_S11, 0, 2),
-    (DeviceType.RUNNER_S12, 0, 1),
-    (DeviceType.RUNNER_S12, 1, 2),
+@mark.asyncio
+@mark.parametrize("result, username, token, is_token_valid", [
+    ("True", "test@switcher.com", "zvVvd7JxtN7CgvkD1Psujw==", True),
+    ("False", "test@switcher.com", "", False),
+    ("False", "test@switcher.com", "notvalidtoken", False),
+    ("False", "", "notvalidtoken", False),
+    ("False", "", "", False)
     ])
-def test_get_shutter_discovery_packet_index_should_return_expected_index(device_type, circuit_number, index):
-    assert_that(tools.get_shutter_discovery_packet_index(device_type, circuit_number)).is_equal_to(index)
+async def test_validate_token_should_return_the_token_validity(mock_post, result, username, token, is_token_valid):
+    mock_response = mock_post.return_value.__aenter__.return_value
+    mock_response.status = 200
+    mock_response.json = AsyncMock(return_value={"result": result})
+    assert await tools.validate_token(username, token) == is_token_valid
 
 
-@mark.parametrize("device_type, circuit_number, error, error_msg", [
-    (DeviceType.RUNNER, 1, ValueError, "Invalid circuit number"),
-    (DeviceType.RUNNER_MINI, 1, ValueError, "Invalid circuit number"),
-    (DeviceType.RUNNER_S11, 1, ValueError, "Invalid circuit number"),
-    (DeviceType.RUNNER_S12, 2, ValueError, "Invalid circuit number"),
-    ])
-def test_get_shutter_discovery_packet_index_with_invalid_circuit_number_should_raise_error(device_type, circuit_number, error, error_msg):
-    assert_that(tools.get_shutter_discovery_packet_index).raises(error).when_called_with(
-        device_type,
-        circuit_number
-    ).is_equal_to(error_msg)
-
-
-@mark.parametrize("device_type, circuit_number, error, error_msg", [
-    (DeviceType.TOUCH, 0, ValueError, "only shutters are allowed")
-    ])
-def test_get_shutter_discovery_packet_index_with_different_device_should_raise_error(device_type, circuit_number, error, error_msg):
-    assert_that(tools.get_shutter_discovery_packet_index).raises(error).when_called_with(
-        device_type,
-        circuit_number
-    ).is_equal_to(error_msg)
-
-
-@mark.parametrize("device_type, circuit_number, index", [
-    (DeviceType.RUNNER_S11, 0, 0),
-    (DeviceType.RUNNER_S11, 1, 1),
-    (DeviceType.RUNNER_S12, 0, 0),
-    (DeviceType.LIGHT_SL01, 0, 0),
-    (DeviceType.LIGHT_SL01_MINI, 0, 0),
+@mark.parametrize("device_type, circuit_number, discovery_index, api_index", [
+    (DeviceType.RUNNER, 0, 0, 1),
+    (DeviceType.RUNNER_MINI, 0, 0, 1),
+    (DeviceType.RUNNER_S11, 0, 2, 3),
+    (DeviceType.RUNNER_S12, 0, 1, 2),
+    (DeviceType.RUNNER_S12, 1, 2, 3),
     ])
-def test_get_light_discovery_packet_index_should_return_expected_index(device_type, circuit_number, index):
-    assert_that(tools.get_light_discovery_packet_index(device_type, circuit_number)).is_equal_to(index)
-
-
-@mark.parametrize("device_type, circuit_number, error, error_msg", [
-    (DeviceType.RUNNER_S11, 2, ValueError, "Invalid circuit number"),
-    (DeviceType.RUNNER_S12, 1, ValueError, "Invalid circuit number"),
-    (DeviceType.LIGHT_SL01, 1, ValueError, "Invalid circuit number"),
-    (DeviceType.LIGHT_SL01_MINI, 1, ValueError, "Invalid circuit number")
-    ])
-def test_get_light_discovery_packet_index_with_invalid_circuit_number_should_raise_error(device_type, circuit_number, error, error_msg):
-    assert_that(tools.get_light_discovery_packet_index).raises(error).when_called_with(
-        device_type,
-        circuit_number
-    ).is_equal_to(error_msg)
-
-
-@mark.parametrize("device_type, circuit_number, error, error_msg", [
-    (DeviceType.TOUCH, 0, ValueError, "only devices that has lights are allowed")
-    ])
-def test_get_light_discovery_packet_index_with_different_device_should_raise_error(device_type, circuit_number, error, error_msg):
-    assert_that(tools.get_light_discovery_packet_index).raises(error).when_called_with(
-        device_type,
-        circuit_number
-    ).is_equal_to(error_msg)
-
-
-@mark.parametrize("device_type, circuit_number, index", [
-    (DeviceType.RUNNER, 0, 1),
-    (DeviceType.RUNNER_MINI, 0, 1),
-    (DeviceType.RUNNER_S11, 0, 3),
-    (DeviceType.RUNNER_S12, 0, 2),
-    (DeviceType.RUNNER_S12, 1, 3),
-    ])
-def test_get_shutter_api_packet_index_should_return_expected_index(device_type, circuit_number, index):
-    assert_that(tools.get_shutter_api_packet_index(device_type, circuit_number)).is_equal_to(index)
+def test_get_shutter_packet_indexes_should_return_expected_indexes(device_type, circuit_number, discovery_index, api_index):
+    assert tools.get_shutter_discovery_packet_index(device_type, circuit_number) == discovery_index
+    assert tools.get_shutter_api_packet_index(device_type, circuit_number) == api_index
 
 
+@mark.parametrize("get_index", [tools.get_shutter_discovery_packet_index, tools.get_shutter_api_packet_index])
 @mark.parametrize("device_type, circuit_number, error, error_msg", [
     (DeviceType.RUNNER, 1, ValueError, "Invalid circuit number"),
     (DeviceType.RUNNER_MINI, 1, ValueError, "Invalid circuit number"),
     (DeviceType.RUNNER_S11, 1, ValueError, "Invalid circuit number"),
     (DeviceType.RUNNER_S12, 2, ValueError, "Invalid circuit number"),
+    (DeviceType.TOUCH, 0, ValueError, "only shutters are allowed"),
     ])
-def test_get_shutter_api_packet_index_with_invalid_circuit_number_should_raise_error(device_type, circuit_number, error, error_msg):
-    assert_that(tools.get_shutter_api_packet_index).raises(error).when_called_with(
-        device_type,
-        circuit_number
-    ).is_equal_to(error_msg)
+def test_get_shutter_packet_indexes_with_invalid_arguments_should_raise_error(get_index, device_type, circuit_number, error, error_msg):
+    with raises(error, match=error_msg):
+        get_index(device_type, circuit_number)
 
 
-@mark.parametrize("device_type, circuit_number, error, error_msg", [
-    (DeviceType.TOUCH, 0, ValueError, "only shutters are allowed")
-    ])
-def test_get_shutter_api_packet_index_with_different_device_should_raise_error(device_type, circuit_number, error, error_msg):
-    assert_that(tools.get_shutter_api_packet_index).raises(error).when_called_with(
-        device_type,
-        circuit_number
-    ).is_equal_to(error_msg)
-
-
-@mark.parametrize("device_type, circuit_number, index", [
-    (DeviceType.RUNNER_S11, 0, 1),
-    (DeviceType.RUNNER_S11, 1, 2),
-    (DeviceType.RUNNER_S12, 0, 1),
-    (DeviceType.LIGHT_SL01, 0, 1),
-    (DeviceType.LIGHT_SL01_MINI, 0, 1),
+@mark.parametrize("device_type, circuit_number, discovery_index, api_index", [
+    (DeviceType.RUNNER_S11, 0, 0, 1),
+    (DeviceType.RUNNER_S11, 1, 1, 2),
+    (DeviceType.RUNNER_S12, 0, 0, 1),
+    (DeviceType.LIGHT_SL01, 0, 0, 1),
+    (DeviceType.LIGHT_SL01_MINI, 0, 0, 1),
     ])
-def test_get_light_api_packet_index_should_return_expected_index(device_type, circuit_number, index):
-    assert_that(tools.get_light_api_packet_index(device_type, circuit_number)).is_equal_to(index)
+def test_get_light_packet_indexes_should_return_expected_indexes(device_type, circuit_number, discovery_index, api_index):
+    assert tools.get_light_discovery_packet_index(device_type, circuit_number) == discovery_index
+    assert tools.get_light_api_packet_index(device_type, circuit_number) == api_index
 
 
+@mark.parametrize("get_index", [tools.get_light_discovery_packet_index, tools.get_light_api_packet_index])
 @mark.parametrize("device_type, circuit_number, error, error_msg", [
     (DeviceType.RUNNER_S11, 2, ValueError, "Invalid circuit number"),
     (DeviceType.RUNNER_S12, 1, ValueError, "Invalid circuit number"),
     (DeviceType.LIGHT_SL01, 1, ValueError, "Invalid circuit number"),
-    (DeviceType.LIGHT_SL01_MINI, 1, ValueError, "Invalid circuit number")
-    ])
-def test_get_light_api_packet_index_with_invalid_circuit_number_should_raise_error(device_type, circuit_number, error, error_msg):
-    assert_that(tools.get_light_api_packet_index).raises(error).when_called_with(
-        device_type,
-        circuit_number
-    ).is_equal_to(error_msg)
-
-
-@mark.parametrize("device_type, circuit_number, error, error_msg", [
-    (DeviceType.TOUCH, 0, ValueError, "only devices that has lights are allowed")
+    (DeviceType.LIGHT_SL01_MINI, 1, ValueError, "Invalid circuit number"),
+    (DeviceType.TOUCH, 0, ValueError, "only devices that has lights are allowed"),
     ])
-def test_get_light_api_packet_index_with_different_device_should_raise_error(device_type, circuit_number, error, error_msg):
-    assert_that(tools.get_light_api_packet_index).raises(error).when_called_with(
-        device_type,
-        circuit_number
-    ).is_equal_to(error_msg)
+def test_get_light_packet_indexes_with_invalid_arguments_should_raise_error(get_index, device_type, circuit_number, error, error_msg):
+    with raises(error, match=error_msg):
+        get_index(device_type, circuit_number)
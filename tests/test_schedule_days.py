@@ -14,7 +14,6 @@
 
 """Verify the custom enum of Days."""
 
-from assertpy import assert_that
 from pytest import mark
 
 from aioswitcher.schedule import Days
@@ -30,7 +29,7 @@
     (Days.SUNDAY, "Sunday", 0x80, 128, 6),
 ])
 def test_the_and_verify_the_paramerized_member_of_the_days_enum(sut_day, expected_value, expected_hex_rep, expected_bit_rep, expected_weekday):
-    assert_that(sut_day.value).is_equal_to(expected_value)
-    assert_that(sut_day.hex_rep).is_equal_to(expected_hex_rep)
-    assert_that(sut_day.bit_rep).is_equal_to(expected_bit_rep)
-    assert_that(sut_day.weekday).is_equal_to(expected_weekday)
+    assert sut_day.value == expected_value
+    assert sut_day.hex_rep == expected_hex_rep
+    assert sut_day.bit_rep == expected_bit_rep
+    assert sut_day.weekday == expected_weekday
@@ -14,10 +14,9 @@
 
 """Switcher integration schedule parser module test cases."""
 
-from binascii import unhexlify
 from pathlib import Path
 
-from assertpy import assert_that
+from pytest import mark
 
 from aioswitcher.schedule import Days, ScheduleState
 from aioswitcher.schedule.parser import ScheduleParser, SwitcherSchedule, get_schedules
@@ -25,73 +24,48 @@
 
 def test_switcher_schedule_dataclass_to_verify_the_post_initialization_of_the_dispaly_and_duration():
     sut = SwitcherSchedule("1", False, set(), "13:00", "14:00")
-    assert_that(sut.duration).is_equal_to("1:00:00")
-    assert_that(sut.display).is_equal_to("Due today at 13:00")
+    assert sut.duration == "1:00:00"
+    assert sut.display == "Due today at 13:00"
 
 
 def test_switcher_schedule_dataclass_to_verify_equality_and_hashing():
     sut0 = SwitcherSchedule("0", False, set(), "13:00", "14:00")
     sut1 = SwitcherSchedule("1", False, set(), "13:00", "14:00")
-    assert_that(sut0.__eq__(sut0)).is_true()
-    assert_that(sut0.__eq__(sut1)).is_false()
-    assert_that(sut0.__eq__(object())).is_false()
-
-
-def test_schedule_parser_with_a_weekly_recurring_enabled_schedule_data():
-    schedule_data = b"01010201e06aa35cf078a35cce0e0000"
-    sut = ScheduleParser(schedule_data)
-    assert_that(sut.get_id()).is_equal_to("1")
-    assert_that(sut.is_enabled()).is_true()
-    assert_that(sut.is_recurring()).is_true()
-    assert_that(sut.get_days()).contains_only(Days.MONDAY)
-    assert_that(sut.get_start_time()).is_equal_to("17:00")
-    assert_that(sut.get_end_time()).is_equal_to("18:00")
-    assert_that(sut.get_state()).is_equal_to(ScheduleState.ENABLED)
-    assert_that(sut.schedule).is_equal_to(schedule_data)
-
-
-def test_schedule_parser_with_a_daily_recurring_enabled_schedule_data():
-    schedule_data = b"0101fe01e06aa35cf078a35cce0e0000"
-    sut = ScheduleParser(schedule_data)
-    assert_that(sut.get_id()).is_equal_to("1")
-    assert_that(sut.is_enabled()).is_true()
-    assert_that(sut.is_recurring()).is_true()
-    assert_that(sut.get_days()).is_equal_to(set(Days))
-    assert_that(sut.get_start_time()).is_equal_to("17:00")
-    assert_that(sut.get_end_time()).is_equal_to("18:00")
-    assert_that(sut.get_state()).is_equal_to(ScheduleState.ENABLED)
-    assert_that(sut.schedule).is_equal_to(schedule_data)
-
-
-def test_schedule_parser_with_a_partial_daily_recurring_enabled_schedule_data():
-    schedule_data = b"0001fc01e871a35cf87fa35cce0e0000"
-    sut = ScheduleParser(schedule_data)
-    assert_that(sut.get_id()).is_equal_to("0")
-    assert_that(sut.is_enabled()).is_true()
-    assert_that(sut.is_recurring()).is_true()
-    assert_that(sut.get_days()).contains_only(Days.SUNDAY, Days.SATURDAY, Days.FRIDAY, Days.THURSDAY, Days.TUESDAY, Days.WEDNESDAY)
-    assert_that(sut.get_start_time()).is_equal_to("17:30")
-    assert_that(sut.get_end_time()).is_equal_to("18:30")
-    assert_that(sut.get_state()).is_equal_to(ScheduleState.ENABLED)
-    assert_that(sut.schedule).is_equal_to(schedule_data)
-
-
-def test_schedule_parser_with_a_non_recurring_enabled_schedule_data():
-    schedule_data = b"01010001e06aa35cf078a35cce0e0000"
+    assert sut0.__eq__(sut0)
+    assert not sut0.__eq__(sut1)
+    assert not sut0.__eq__(object())
+
+
+@mark.parametrize("schedule_data, expected_id, expected_recurring, expected_days, expected_start_time, expected_end_time", [
+    (b"01010201e06aa35cf078a35cce0e0000", "1", True, {Days.MONDAY}, "17:00", "18:00"),
+    (b"0101fe01e06aa35cf078a35cce0e0000", "1", True, set(Days), "17:00", "18:00"),
+    (
+        b"0001fc01e871a35cf87fa35cce0e0000",
+        "0",
+        True,
+        {Days.SUNDAY, Days.SATURDAY, Days.FRIDAY, Days.THURSDAY, Days.TUESDAY, Days.WEDNESDAY},
+        "17:30",
+        "18:30",
+    ),
+    (b"01010001e06aa35cf078a35cce0e0000", "1", False, set(), "17:00", "18:00"),
+], ids=["weekly_recurring", "daily_recurring", "partial_daily_recurring", "non_recurring"])
+def test_schedule_parser_with_an_enabled_schedule_data(
+    schedule_data, expected_id, expected_recurring, expected_days, expected_start_time, expected_end_time
+):
     sut = ScheduleParser(schedule_data)
-    assert_that(sut.get_id()).is_equal_to("1")
-    assert_that(sut.is_enabled()).is_true()
-    assert_that(sut.is_recurring()).is_false()
-    assert_that(sut.get_days()).is_empty()
-    assert_that(sut.get_start_time()).is_equal_to("17:00")
-    assert_that(sut.get_end_time()).is_equal_to("18:00")
-    assert_that(sut.get_state()).is_equal_to(ScheduleState.ENABLED)
-    assert_that(sut.schedule).is_equal_to(schedule_data)
+    assert sut.get_id() == expected_id
+    assert sut.is_enabled()
+    assert sut.is_recurring() == expected_recurring
+    assert sut.get_days() == expected_days
+    assert sut.get_start_time() == expected_start_time
+    assert sut.get_end_time() == expected_end_time
+    assert sut.get_state() == ScheduleState.ENABLED
+    assert sut.schedule == schedule_data
 
 
 def test_get_schedules_with_a_two_schedules_packet(resource_path):
-    response = Path(f'{resource_path}.txt').read_text().replace('\n', '').encode()
-    set_of_schedules = get_schedules(unhexlify(response))
-    assert_that(set_of_schedules).is_length(2)
+    response = bytes.fromhex(Path(f'{resource_path}.txt').read_text())
+    set_of_schedules = get_schedules(response)
+    assert len(set_of_schedules) == 2
     for schedule in set_of_schedules:
-        assert_that(schedule).is_instance_of(SwitcherSchedule)
+        assert isinstance(schedule, SwitcherSchedule)
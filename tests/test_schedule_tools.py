@@ -14,52 +14,76 @@
 
 """Switcher integration pretty next run tool test cases."""
 
-from binascii import hexlify, unhexlify
 from datetime import datetime, timedelta
-from struct import pack, unpack
 
-import time_machine
-from assertpy import assert_that
-from freezegun import freeze_time
-from pytest import fixture, mark
+from pytest import fixture, mark, param, raises
 
 from aioswitcher.schedule import Days, tools
 
-days_by_weekdays = dict(map(lambda d: (d.weekday, d), Days))
+days_by_weekdays = {d.weekday: d for d in Days}
 
+MONDAY = frozenset({Days.MONDAY})
+MONDAY_TO_TUESDAY = MONDAY | {Days.TUESDAY}
+MONDAY_TO_WEDNESDAY = MONDAY_TO_TUESDAY | {Days.WEDNESDAY}
+MONDAY_TO_THURSDAY = MONDAY_TO_WEDNESDAY | {Days.THURSDAY}
+MONDAY_TO_FRIDAY = MONDAY_TO_THURSDAY | {Days.FRIDAY}
+MONDAY_TO_SATURDAY = MONDAY_TO_FRIDAY | {Days.SATURDAY}
+ALL_WEEK = frozenset(Days)
 
-@fixture()
+
+@fixture(scope="module")
 def today():
     return datetime.utcnow()
 
 
-@fixture
+@fixture(scope="module")
+def local_now():
+    # whole seconds, so rounding the timestamp never moves it to the next minute
+    return datetime.now().replace(microsecond=0)
+
+
+@fixture(scope="module")
 def todays_day(today):
     return days_by_weekdays[today.weekday()]
 
 
-@fixture
+@fixture(scope="module")
 def one_hour_from_now(today):
-    return datetime.strftime(today + timedelta(hours=1), "%H:%M")
+    in_one_hour = today + timedelta(hours=1)
+    return f"{in_one_hour.hour:02d}:{in_one_hour.minute:02d}"
+
+
+@fixture(scope="module")
+def yesterday(today):
+    return today - timedelta(days=1)
+
+
+@fixture(scope="module")
+def two_days_ago(today):
+    return today - timedelta(days=2)
+
+
+@fixture(scope="module")
+def last_sunday(today):
+    return today - timedelta(days=((today.weekday() + 1) % 7))
 
 
 def test_pretty_next_run_with_no_selected_days_should_return_due_today(one_hour_from_now):
     expected_return = f"Due today at {one_hour_from_now}"
-    assert_that(tools.pretty_next_run(one_hour_from_now)).is_equal_to(expected_return)
+    assert tools.pretty_next_run(one_hour_from_now) == expected_return
 
 
 def test_pretty_next_run_with_todays_day_should_return_due_today(todays_day, one_hour_from_now):
     expected_return = f"Due today at {one_hour_from_now}"
-    assert_that(tools.pretty_next_run(one_hour_from_now, {todays_day})).is_equal_to(expected_return)
+    assert tools.pretty_next_run(one_hour_from_now, {todays_day}) == expected_return
 
 
-@freeze_time("2024-01-01 23:00:00")
 def test_pretty_next_run_with_specific_date_and_time_end_of_day_should_return_due_today():
     # todays_day at 2024-01-01 is Monday which is 0
     todays_day = days_by_weekdays[0]
     one_hour_from_now = "00:00"
     expected_return = f"Due today at {one_hour_from_now}"
-    assert_that(tools.pretty_next_run(one_hour_from_now, {todays_day})).is_equal_to(expected_return)
+    assert tools.pretty_next_run(one_hour_from_now, {todays_day}, now=datetime(2024, 1, 1, 23, 0)) == expected_return
 
 
 def test_pretty_next_run_with_multiple_days_should_return_due_the_closest_day(today):
@@ -71,113 +95,84 @@ def test_pretty_next_run_with_multiple_days_should_return_due_the_closest_day(to
 
     expected_return = f"Due next {two_days_from_now_day.value} at 13:00"
 
-    assert_that(tools.pretty_next_run("13:00", {four_days_from_now_day, two_days_from_now_day})).is_equal_to(expected_return)
+    assert tools.pretty_next_run("13:00", {four_days_from_now_day, two_days_from_now_day}) == expected_return
 
 
-def test_pretty_next_run_on_yesterday_with_todays_day_should_return_due_tomorrow(today, todays_day):
+def test_pretty_next_run_on_yesterday_with_todays_day_should_return_due_tomorrow(yesterday, todays_day):
     expected_return = "Due tomorrow at 13:00"
-    yesterday = today - timedelta(days=1)
-    with time_machine.travel(yesterday):
-        assert_that(tools.pretty_next_run("13:00", {todays_day})).is_equal_to(expected_return)
+    assert tools.pretty_next_run("13:00", {todays_day}, now=yesterday) == expected_return
 
 
-def test_pretty_next_run_on_two_days_ago_with_todays_day_should_return_due_on_next_day(today, todays_day):
+def test_pretty_next_run_on_two_days_ago_with_todays_day_should_return_due_on_next_day(two_days_ago, todays_day):
     expected_return = f"Due next {todays_day.value} at 13:00"
-    two_days_ago = today - timedelta(days=2)
-    with time_machine.travel(two_days_ago):
-        assert_that(tools.pretty_next_run("13:00", {todays_day})).is_equal_to(expected_return)
+    assert tools.pretty_next_run("13:00", {todays_day}, now=two_days_ago) == expected_return
 
 
-def test_pretty_next_run_on_last_sunday_with_monday_selected_should_return_due_tomorrow(today):
+def test_pretty_next_run_on_last_sunday_with_monday_selected_should_return_due_tomorrow(last_sunday):
     expected_return = "Due tomorrow at 13:00"
-    last_sunday = today - timedelta(days=((today.weekday() + 1) % 7))
-    with time_machine.travel(last_sunday):
-        assert_that(tools.pretty_next_run("13:00", {Days.MONDAY})).is_equal_to(expected_return)
+    assert tools.pretty_next_run("13:00", {Days.MONDAY}, now=last_sunday) == expected_return
 
 
 def test_calc_duration_with_valid_start_and_end_time_should_return_the_duration():
-    assert_that(tools.calc_duration("13:00", "14:00")).is_equal_to("1:00:00")
+    assert tools.calc_duration("13:00", "14:00") == "1:00:00"
 
 
 def test_calc_duration_with_greater_start_time_than_end_time_should_assume_next_day():
-    assert_that(tools.calc_duration("14:00", "13:00")).is_equal_to("23:00:00")
+    assert tools.calc_duration("14:00", "13:00") == "23:00:00"
 
 
-def test_hexadecimale_timestamp_to_localtime_with_the_current_timestamp_should_return_a_time_string():
-    sut_datetime = datetime.now()
-    hex_timestamp = hexlify(pack("<I", round(sut_datetime.timestamp())))
-    assert_that(
-        tools.hexadecimale_timestamp_to_localtime(hex_timestamp)
-    ).is_equal_to(sut_datetime.time().strftime("%H:%M"))
+def test_hexadecimale_timestamp_to_localtime_with_the_current_timestamp_should_return_a_time_string(local_now):
+    hex_timestamp = round(local_now.timestamp()).to_bytes(4, "little").hex().encode()
+    assert tools.hexadecimale_timestamp_to_localtime(hex_timestamp) == local_now.strftime("%H:%M")
 
 
 def test_hexadecimale_timestamp_to_localtime_with_wrong_value_should_throw_an_error():
-    assert_that(tools.hexadecimale_timestamp_to_localtime).raises(
-        ValueError
-    ).when_called_with("wrongvalue".encode()).starts_with("invalid literal for int() with base 16")
-
-
-@mark.parametrize("sum, expected_weekdays", [
-    (2, {Days.MONDAY}),
-    (6, {Days.MONDAY, Days.TUESDAY}),
-    (14, {Days.MONDAY, Days.TUESDAY, Days.WEDNESDAY},),
-    (30, {Days.MONDAY, Days.TUESDAY, Days.WEDNESDAY, Days.THURSDAY}),
-    (62, {Days.MONDAY, Days.TUESDAY, Days.WEDNESDAY, Days.THURSDAY, Days.FRIDAY}),
-    (126, {Days.MONDAY, Days.TUESDAY, Days.WEDNESDAY, Days.THURSDAY, Days.FRIDAY, Days.SATURDAY}),
-    (254, {Days.MONDAY, Days.TUESDAY, Days.WEDNESDAY, Days.THURSDAY, Days.FRIDAY, Days.SATURDAY, Days.SUNDAY}),
-])
-def test_bit_summary_to_days_with_parameterized_sum_should_return_the_expected_weekday_set(sum, expected_weekdays):
-    assert_that(tools.bit_summary_to_days(sum)).is_equal_to(expected_weekdays)
-
-
-@mark.parametrize("wrong_bit_sum", [1, 255])
-def test_bit_summary_to_days_with_wrong_bit_sum_parameterized_value(wrong_bit_sum):
-    assert_that(tools.bit_summary_to_days).raises(
-        ValueError
-    ).when_called_with(wrong_bit_sum).is_equal_to("weekdays bit sum should be between 2 and 254")
+    with raises(ValueError, match=r"^invalid literal for int\(\) with base 16"):
+        tools.hexadecimale_timestamp_to_localtime("wrongvalue".encode())
 
 
 @mark.parametrize("weekdays, expected_sum", [
-    (Days.MONDAY, 2),
-    ({Days.MONDAY, Days.TUESDAY}, 6),
-    ({Days.MONDAY, Days.TUESDAY, Days.WEDNESDAY}, 14),
-    ({Days.MONDAY, Days.TUESDAY, Days.WEDNESDAY, Days.THURSDAY}, 30),
-    ({Days.MONDAY, Days.TUESDAY, Days.WEDNESDAY, Days.THURSDAY, Days.FRIDAY}, 62),
-    ({Days.MONDAY, Days.TUESDAY, Days.WEDNESDAY, Days.THURSDAY, Days.FRIDAY, Days.SATURDAY}, 126),
-    ({Days.MONDAY, Days.TUESDAY, Days.WEDNESDAY, Days.THURSDAY, Days.FRIDAY, Days.SATURDAY, Days.SUNDAY}, 254),
+    param(Days.MONDAY, 2, id="monday_member"),
+    param(MONDAY, 2, id="monday"),
+    param(MONDAY_TO_TUESDAY, 6, id="monday_to_tuesday"),
+    param(MONDAY_TO_WEDNESDAY, 14, id="monday_to_wednesday"),
+    param(MONDAY_TO_THURSDAY, 30, id="monday_to_thursday"),
+    param(MONDAY_TO_FRIDAY, 62, id="monday_to_friday"),
+    param(MONDAY_TO_SATURDAY, 126, id="monday_to_saturday"),
+    param(ALL_WEEK, 254, id="all_week"),
 ])
-def test_weekdays_to_hexadecimal_with_parameterized_weekday_set_should_return_the_expected_sum(weekdays, expected_sum):
-    sut_hex = tools.weekdays_to_hexadecimal(weekdays)
-    sut_int = int(sut_hex, 16)
-    assert_that(sut_int).is_equal_to(expected_sum)
+def test_weekdays_to_hexadecimal_and_bit_summary_to_days_should_round_trip(weekdays, expected_sum):
+    assert int(tools.weekdays_to_hexadecimal(weekdays), 16) == expected_sum
+    assert tools.bit_summary_to_days(expected_sum) == ({weekdays} if isinstance(weekdays, Days) else weekdays)
 
 
-@mark.parametrize("empty_collection", [set(), (), {}, []])
-def test_weekdays_to_hexadecimal_with_empty_collections_should_throw_an_error(empty_collection):
-    assert_that(tools.weekdays_to_hexadecimal).raises(
-        ValueError
-    ).when_called_with(empty_collection).is_equal_to("no days requested")
+@mark.parametrize("wrong_bit_sum", [1, 255])
+def test_bit_summary_to_days_with_wrong_bit_sum_parameterized_value(wrong_bit_sum):
+    with raises(ValueError, match="^weekdays bit sum should be between 2 and 254$"):
+        tools.bit_summary_to_days(wrong_bit_sum)
 
 
-@mark.parametrize("duplicate_members", [(Days.MONDAY, Days.MONDAY), [Days.MONDAY, Days.MONDAY]])
-def test_weekdays_to_hexadecimal_with_duplicate_members_should_throw_an_encoding_error(duplicate_members):
-    assert_that(tools.weekdays_to_hexadecimal).raises(
-        ValueError
-    ).when_called_with(duplicate_members).is_equal_to("no days requested")
+@mark.parametrize("wrong_days", [
+    param(set(), id="empty_set"),
+    param((), id="empty_tuple"),
+    param({}, id="empty_dict"),
+    param([], id="empty_list"),
+    param((Days.MONDAY, Days.MONDAY), id="duplicate_members_tuple"),
+    param([Days.MONDAY, Days.MONDAY], id="duplicate_members_list"),
+])
+def test_weekdays_to_hexadecimal_with_empty_or_duplicate_days_should_throw_an_error(wrong_days):
+    with raises(ValueError, match="^no days requested$"):
+        tools.weekdays_to_hexadecimal(wrong_days)
 
 
-def test_time_to_hexadecimal_timestamp_with_correct_time_should_return_the_expected_timestamp():
+def test_time_to_hexadecimal_timestamp_with_correct_time_should_return_the_expected_timestamp(local_now):
     hex_timestamp = tools.time_to_hexadecimal_timestamp("21:00")
 
-    binary_timestamp = unhexlify(hex_timestamp.encode())
-    unpacked_timestamp = unpack("<I", binary_timestamp)
-    sut_datetime = datetime.fromtimestamp(unpacked_timestamp[0])
-    assert_that(
-        sut_datetime
-    ).is_equal_to_ignoring_time(datetime.now()).has_hour(21).has_minute(0)
+    sut_datetime = datetime.fromtimestamp(int.from_bytes(bytes.fromhex(hex_timestamp), "little"))
+    assert sut_datetime.date() == local_now.date()
+    assert (sut_datetime.hour, sut_datetime.minute) == (21, 0)
 
 
 def test_time_to_hexadecimal_timestamp_with_incorrect_time_should_throw_an_error():
-    assert_that(tools.time_to_hexadecimal_timestamp).raises(
-        IndexError
-    ).when_called_with("2100").is_equal_to("list index out of range")
+    with raises(IndexError, match="^list index out of range$"):
+        tools.time_to_hexadecimal_timestamp("2100")
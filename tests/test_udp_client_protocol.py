@@ -14,28 +14,33 @@
 
 """Switcher integration udp client protocol test cases."""
 
+from logging import Logger
 from unittest.mock import Mock, patch
 
-from assertpy import assert_that
 from pytest import fixture, warns
 
 from aioswitcher.bridge import UdpClientProtocol
 
 
-@fixture
+@fixture(scope="module")
 def mock_callback():
     return Mock()
 
 
-@fixture
+@fixture(scope="module")
 def sut_protocol(mock_callback):
     return UdpClientProtocol(mock_callback)
 
 
+@fixture(autouse=True)
+def reset_mock_callback(mock_callback):
+    mock_callback.reset_mock()
+
+
 def test_given_transport_when_connection_made_then_transport_should_be_served(sut_protocol):
     mock_transport = Mock()
     sut_protocol.connection_made(mock_transport)
-    assert_that(sut_protocol.transport).is_equal_to(mock_transport)
+    assert sut_protocol.transport == mock_transport
 
 
 def test_given_datagram_when_sut_received_then_the_callback_is_called(sut_protocol, mock_callback):
@@ -49,19 +54,19 @@ def test_error_received_with_no_error_should_issue_a_warning(sut_protocol):
         sut_protocol.error_received(None)
 
 
-@patch("logging.Logger.error")
+@patch.object(Logger, "error")
 def test_error_received_with_an_actual_error_should_write_to_the_error_output(mock_error, sut_protocol):
     sut_protocol.error_received(Exception("dummy"))
     mock_error.assert_called_once_with("udp client received error dummy")
 
 
-@patch("logging.Logger.info")
+@patch.object(Logger, "info")
 def test_connection_lost_with_no_error_should_write_to_the_info_output(mock_info, sut_protocol):
     sut_protocol.connection_lost(None)
     mock_info.assert_called_once_with("udp connection stopped")
 
 
-@patch("logging.Logger.critical")
+@patch.object(Logger, "critical")
 def test_connection_lost_with_an_actual_error_should_write_to_the_critical_output(mock_critical, sut_protocol):
     sut_protocol.connection_lost(Exception("dummy"))
     mock_critical.assert_called_once_with("udp bridge lost its connection dummy")
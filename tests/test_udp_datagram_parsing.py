@@ -14,10 +14,8 @@
 
 """Switcher integration broadcast message parsing utility functions test cases."""
 
-from binascii import unhexlify
 from pathlib import Path
 
-from assertpy import assert_that
 from pytest import mark
 
 from aioswitcher.bridge import DatagramParser
@@ -33,21 +31,21 @@
     ("v4", DeviceType.V4),
 ])
 def test_datagram_state_off(resource_path, type_suffix, expected_type):
-    sut_datagram = Path(f'{resource_path}_{type_suffix}.txt').read_text().replace('\n', '').encode()
+    sut_datagram = bytes.fromhex(Path(f'{resource_path}_{type_suffix}.txt').read_text())
 
-    sut_parser = DatagramParser(unhexlify(sut_datagram))
+    sut_parser = DatagramParser(sut_datagram)
 
-    assert_that(sut_parser.is_switcher_originator()).is_true()
-    assert_that(sut_parser.get_ip_type1()).is_equal_to("192.168.1.33")
-    assert_that(sut_parser.get_mac_type1()).is_equal_to("12:A1:A2:1A:BC:1A")
-    assert_that(sut_parser.get_name()).is_equal_to("My Switcher Boiler")
-    assert_that(sut_parser.get_device_id()).is_equal_to("aaaaaa")
-    assert_that(sut_parser.get_device_state()).is_equal_to(DeviceState.OFF)
-    assert_that(sut_parser.get_device_type()).is_equal_to(expected_type)
-    assert_that(sut_parser.get_power_consumption()).is_equal_to(0)
+    assert sut_parser.is_switcher_originator()
+    assert sut_parser.get_ip_type1() == "192.168.1.33"
+    assert sut_parser.get_mac_type1() == "12:A1:A2:1A:BC:1A"
+    assert sut_parser.get_name() == "My Switcher Boiler"
+    assert sut_parser.get_device_id() == "aaaaaa"
+    assert sut_parser.get_device_state() == DeviceState.OFF
+    assert sut_parser.get_device_type() == expected_type
+    assert sut_parser.get_power_consumption() == 0
     if not expected_type == DeviceType.POWER_PLUG:
-        assert_that(sut_parser.get_remaining()).is_equal_to("00:00:00")
-        assert_that(sut_parser.get_auto_shutdown()).is_equal_to("03:00:00")
+        assert sut_parser.get_remaining() == "00:00:00"
+        assert sut_parser.get_auto_shutdown() == "03:00:00"
 
 
 @mark.parametrize("type_suffix, expected_type", [
@@ -59,25 +57,25 @@ def test_datagram_state_off(resource_path, type_suffix, expected_type):
     ("v4", DeviceType.V4),
 ])
 def test_datagram_state_on(resource_path, type_suffix, expected_type):
-    sut_datagram = Path(f'{resource_path}_{type_suffix}.txt').read_text().replace('\n', '').encode()
+    sut_datagram = bytes.fromhex(Path(f'{resource_path}_{type_suffix}.txt').read_text())
 
-    sut_parser = DatagramParser(unhexlify(sut_datagram))
+    sut_parser = DatagramParser(sut_datagram)
 
-    assert_that(sut_parser.is_switcher_originator()).is_true()
-    assert_that(sut_parser.get_ip_type1()).is_equal_to("192.168.1.33")
-    assert_that(sut_parser.get_mac_type1()).is_equal_to("12:A1:A2:1A:BC:1A")
-    assert_that(sut_parser.get_name()).is_equal_to("My Switcher Boiler")
-    assert_that(sut_parser.get_device_id()).is_equal_to("aaaaaa")
-    assert_that(sut_parser.get_device_state()).is_equal_to(DeviceState.ON)
-    assert_that(sut_parser.get_device_type()).is_equal_to(expected_type)
-    assert_that(sut_parser.get_power_consumption()).is_equal_to(2600)
+    assert sut_parser.is_switcher_originator()
+    assert sut_parser.get_ip_type1() == "192.168.1.33"
+    assert sut_parser.get_mac_type1() == "12:A1:A2:1A:BC:1A"
+    assert sut_parser.get_name() == "My Switcher Boiler"
+    assert sut_parser.get_device_id() == "aaaaaa"
+    assert sut_parser.get_device_state() == DeviceState.ON
+    assert sut_parser.get_device_type() == expected_type
+    assert sut_parser.get_power_consumption() == 2600
     if not expected_type == DeviceType.POWER_PLUG:
-        assert_that(sut_parser.get_remaining()).is_equal_to("01:30:00")
-        assert_that(sut_parser.get_auto_shutdown()).is_equal_to("03:00:00")
+        assert sut_parser.get_remaining() == "01:30:00"
+        assert sut_parser.get_auto_shutdown() == "03:00:00"
 
 
 @mark.parametrize("type_suffix", ["too_short", "wrong_start"])
 def test_a_faulty_datagram(resource_path, type_suffix):
-    sut_datagram = Path(f'{resource_path}_{type_suffix}.txt').read_text().replace('\n', '').encode()
-    sut_parser = DatagramParser(unhexlify(sut_datagram))
-    assert_that(sut_parser.is_switcher_originator()).is_false()
+    sut_datagram = bytes.fromhex(Path(f'{resource_path}_{type_suffix}.txt').read_text())
+    sut_parser = DatagramParser(sut_datagram)
+    assert not sut_parser.is_switcher_originator()